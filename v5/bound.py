@@ -0,0 +1,207 @@
+import itertools
+
+# --- Limites Inferiores e Solução Exata ---
+#
+# O fitness é a soma de três parcelas independentes:
+#   distância da rota + custo fixo das visitas + custo escalado dos hotéis.
+# Como a distância é euclidiana (vale a desigualdade triangular), qualquer rota
+# que passe pelas visitas e pelos hotéis é pelo menos tão longa quanto a
+# melhor rota que passa apenas pelas visitas. Assim, um limite inferior válido
+# é: limite do TSP das visitas + custo das visitas + os hotéis mais baratos.
+
+# Acima deste número de pontos na rota a programação dinâmica exata fica inviável
+MAX_EXACT_ROUTE_POINTS = 14
+
+
+def one_tree(nodes, distance_matrix, penalties):
+    """Calcula a 1-árvore mínima com custos penalizados (d(i, j) + pi[i] + pi[j]).
+
+    Retorna o custo penalizado da 1-árvore e o grau de cada nó (na ordem de `nodes`).
+    """
+    n = len(nodes)
+    degrees = [0] * n
+
+    def cost(a, b):
+        return distance_matrix[(nodes[a], nodes[b])] + penalties[a] + penalties[b]
+
+    # Árvore geradora mínima (Prim) sobre todos os nós exceto o primeiro
+    total_cost = 0.0
+    in_tree = [False] * n
+    best_edge_cost = [float('inf')] * n
+    best_edge_from = [-1] * n
+    in_tree[1] = True
+    for j in range(2, n):
+        best_edge_cost[j] = cost(1, j)
+        best_edge_from[j] = 1
+
+    for _ in range(n - 2):
+        next_node = -1
+        for j in range(2, n):
+            if not in_tree[j] and (next_node == -1 or best_edge_cost[j] < best_edge_cost[next_node]):
+                next_node = j
+        in_tree[next_node] = True
+        total_cost += best_edge_cost[next_node]
+        degrees[next_node] += 1
+        degrees[best_edge_from[next_node]] += 1
+        for j in range(2, n):
+            if not in_tree[j]:
+                candidate = cost(next_node, j)
+                if candidate < best_edge_cost[j]:
+                    best_edge_cost[j] = candidate
+                    best_edge_from[j] = next_node
+
+    # Liga o primeiro nó à árvore pelas duas arestas mais baratas
+    root_edges = sorted(range(1, n), key=lambda j: cost(0, j))[:2]
+    for j in root_edges:
+        total_cost += cost(0, j)
+        degrees[j] += 1
+    degrees[0] = 2
+
+    return total_cost, degrees
+
+
+def held_karp_lower_bound(nodes, distance_matrix, max_iterations=200):
+    """Limite inferior de Held-Karp para o TSP sobre `nodes`.
+
+    Otimiza as penalidades da relaxação por 1-árvore com subgradiente. Se a
+    1-árvore encontrada for uma rota (todos os graus iguais a 2), o limite é exato.
+    """
+    n = len(nodes)
+    if n < 2:
+        return 0.0
+    if n == 2:
+        return 2 * distance_matrix[(nodes[0], nodes[1])]
+
+    penalties = [0.0] * n
+    best_bound = float('-inf')
+    step = None
+
+    for iteration in range(max_iterations):
+        tree_cost, degrees = one_tree(nodes, distance_matrix, penalties)
+        bound = tree_cost - 2 * sum(penalties)
+        if bound > best_bound:
+            best_bound = bound
+
+        subgradient = [degree - 2 for degree in degrees]
+        norm = sum(g * g for g in subgradient)
+        if norm == 0:
+            break  # A 1-árvore já é uma rota ótima
+
+        if step is None:
+            step = 0.3 * bound / n  # Passo inicial proporcional ao comprimento médio das arestas
+        elif iteration % 20 == 0:
+            step *= 0.5
+
+        for i in range(n):
+            penalties[i] += step * subgradient[i]
+
+    return best_bound
+
+
+def lower_bound(distance_matrix, n_visitas, n_hotels, num_hotels_to_visit, VISIT_FITNESS_COST, hotel_financial_costs_map, COST_SCALE_FACTOR):
+    """Limite inferior rápido para o fitness de qualquer indivíduo da instância."""
+    route_bound = held_karp_lower_bound(list(range(n_visitas)), distance_matrix)
+
+    hotel_costs = sorted(hotel_financial_costs_map[idx]
+                         for idx in range(n_visitas, n_visitas + n_hotels))
+    hotels_bound = sum(hotel_costs[:num_hotels_to_visit]) * COST_SCALE_FACTOR
+
+    return route_bound + n_visitas * VISIT_FITNESS_COST + hotels_bound
+
+# --- Solução Exata (instâncias pequenas) ---
+
+
+def exact_tsp(nodes, distance_matrix):
+    """Rota ótima sobre `nodes` via programação dinâmica de Held-Karp.
+
+    Retorna (distância, rota) com a rota expressa nos índices originais.
+    """
+    n = len(nodes)
+    if n < 2:
+        return 0.0, list(nodes)
+
+    # dp[(mask, j)]: menor custo partindo de nodes[0], visitando `mask` e terminando em j
+    dp = {(1 | (1 << j), j): (distance_matrix[(nodes[0], nodes[j])], 0)
+          for j in range(1, n)}
+
+    for subset_size in range(3, n + 1):
+        for subset in itertools.combinations(range(1, n), subset_size - 1):
+            mask = 1
+            for j in subset:
+                mask |= 1 << j
+            for j in subset:
+                previous_mask = mask & ~(1 << j)
+                best = None
+                for k in subset:
+                    if k == j:
+                        continue
+                    candidate = dp[(previous_mask, k)][0] + \
+                        distance_matrix[(nodes[k], nodes[j])]
+                    if best is None or candidate < best[0]:
+                        best = (candidate, k)
+                dp[(mask, j)] = best
+
+    full_mask = (1 << n) - 1
+    best_distance = float('inf')
+    last = -1
+    for j in range(1, n):
+        candidate = dp[(full_mask, j)][0] + distance_matrix[(nodes[j], nodes[0])]
+        if candidate < best_distance:
+            best_distance = candidate
+            last = j
+
+    # Reconstrói a rota a partir do último nó
+    route = []
+    mask = full_mask
+    while last != 0:
+        route.append(nodes[last])
+        previous = dp[(mask, last)][1]
+        mask &= ~(1 << last)
+        last = previous
+    route.append(nodes[0])
+    route.reverse()
+
+    return best_distance, route
+
+
+def exact_solution(distance_matrix, n_visitas, n_hotels, num_hotels_to_visit, VISIT_FITNESS_COST, hotel_financial_costs_map, COST_SCALE_FACTOR):
+    """Solução ótima para instâncias pequenas.
+
+    Testa cada combinação de hotéis e resolve o TSP exato correspondente,
+    descartando combinações cujo limite inferior já supera a melhor solução.
+    Retorna (fitness, indivíduo) no mesmo formato de `calculate_fitness`.
+    """
+    if n_visitas + num_hotels_to_visit > MAX_EXACT_ROUTE_POINTS:
+        raise ValueError(
+            f"Instância grande demais para a solução exata ({n_visitas + num_hotels_to_visit} pontos na rota, máximo {MAX_EXACT_ROUTE_POINTS}).")
+
+    visits_bound = held_karp_lower_bound(list(range(n_visitas)), distance_matrix)
+    fixed_cost = n_visitas * VISIT_FITNESS_COST
+
+    best_fitness = float('inf')
+    best_individual = None
+
+    hotel_indices = range(n_visitas, n_visitas + n_hotels)
+    combinations = sorted(itertools.combinations(hotel_indices, num_hotels_to_visit),
+                          key=lambda hotels: sum(hotel_financial_costs_map[idx] for idx in hotels))
+    for selected_hotels in combinations:
+        hotels_cost = sum(hotel_financial_costs_map[idx]
+                          for idx in selected_hotels) * COST_SCALE_FACTOR
+        if visits_bound + fixed_cost + hotels_cost >= best_fitness:
+            break  # Combinações ordenadas por custo: as seguintes também não melhoram
+
+        route_distance, route = exact_tsp(
+            list(range(n_visitas)) + list(selected_hotels), distance_matrix)
+        fitness = route_distance + fixed_cost + hotels_cost
+        if fitness < best_fitness:
+            best_fitness = fitness
+            best_individual = (list(selected_hotels), route)
+
+    return best_fitness, best_individual
+
+
+def optimality_gap(fitness, bound):
+    """Distância relativa (em %) entre o fitness e o limite inferior."""
+    if bound <= 0:
+        return float('inf')
+    return max(0.0, (fitness - bound) / bound * 100)
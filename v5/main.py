@@ -14,6 +14,7 @@ from genetic_algorithm import (
     tournament_selection,
     generate_random_individual
 )
+from bound import lower_bound, exact_solution, optimality_gap, MAX_EXACT_ROUTE_POINTS
 from draw_pygame import draw_paths, draw_plot, draw_locations, draw_text
 import sys
 
@@ -96,6 +97,17 @@ hotel_financial_costs_map = [0.0] * N_VISITAS + [random.uniform(
 
 distance_matrix = precompute_distance_matrix(all_locations)
 
+# --- LIMITE INFERIOR PARA O CÁLCULO DO GAP DE OTIMALIDADE ---
+# Em instâncias pequenas usa a solução exata; nas demais, o limite de Held-Karp + hotéis mais baratos.
+if N_VISITAS + NUM_HOTELS_TO_VISIT <= MAX_EXACT_ROUTE_POINTS:
+    fitness_lower_bound, _ = exact_solution(
+        distance_matrix, N_VISITAS, N_HOTELS, NUM_HOTELS_TO_VISIT, VISIT_FITNESS_COST, hotel_financial_costs_map, COST_SCALE_FACTOR)
+    print(f'Fitness ótimo (solução exata): {round(fitness_lower_bound, 2)}')
+else:
+    fitness_lower_bound = lower_bound(
+        distance_matrix, N_VISITAS, N_HOTELS, NUM_HOTELS_TO_VISIT, VISIT_FITNESS_COST, hotel_financial_costs_map, COST_SCALE_FACTOR)
+    print(f'Limite inferior do fitness: {round(fitness_lower_bound, 2)}')
+
 population = generate_random_population(
     N_VISITAS, N_HOTELS, NUM_HOTELS_TO_VISIT, POPULATION_SIZE)
 
@@ -186,6 +198,7 @@ while running:
         print(f"População parcialmente reinicializada. Nova busca iniciada.")
 
     best_fitness_values.append(current_best_fitness)
+    current_gap = optimality_gap(current_best_fitness, fitness_lower_bound)
 
     draw_plot(screen, list(range(len(best_fitness_values))),
               best_fitness_values, y_label='Fitness - Custo Total')
@@ -221,6 +234,8 @@ while running:
         screen, f'Fitness: {round(current_best_fitness, 2)}', BLACK, (10, y_base + 20))
     draw_text(
         screen, f'Distancia: {round(best_solution_distance, 2)}', BLACK, (10, y_base + 40))
+    draw_text(
+        screen, f'Gap: {round(current_gap, 2)}%', BLACK, (10, y_base + 60))
     draw_text(screen, f'N Visitas: {N_VISITAS}', BLUE, (10, HEIGHT - 50))
     draw_text(
         screen, f'N Hoteis: {N_HOTELS} (Alvo: {NUM_HOTELS_TO_VISIT})', GREEN, (10, HEIGHT - 30))
@@ -249,7 +264,7 @@ while running:
 
     # Imprime informações no console para cada geração (resumido)
     print(
-        f'Generation {generation}: Fitness = {round(current_best_fitness, 2)}')
+        f'Generation {generation}: Fitness = {round(current_best_fitness, 2)} | Gap = {round(current_gap, 2)}%')
 
     # --- CRIAÇÃO DA NOVA GERAÇÃO ---
     if generations_without_improvement < STAGNATION_LIMIT:
@@ -347,6 +362,9 @@ print(f'Distância Total da Rota: {round(final_best_solution_distance, 2)} km')
 print(
     f'Essa viagem de {round(final_best_solution_distance, 2)} KM dura {final_time_str_human_readable}')
 print(f'Fitness Final (Melhor Otimização): {round(best_overall_fitness, 2)}')
+print(f'Limite Inferior do Fitness: {round(fitness_lower_bound, 2)}')
+print(
+    f'Gap de Otimalidade: {round(optimality_gap(best_overall_fitness, fitness_lower_bound), 2)}%')
 
 
 pygame.quit()